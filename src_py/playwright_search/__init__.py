@@ -0,0 +1,5 @@
+"""playwright-search 的 Python 重构版，对应 TypeScript 版本的 src/ 目录。"""
+
+from .types import CommandOptions, SearchResponse, SearchResult
+
+__all__ = ["CommandOptions", "SearchResponse", "SearchResult"]
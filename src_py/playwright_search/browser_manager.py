@@ -0,0 +1,378 @@
+"""浏览器管理器，对应 TypeScript 版本的 browser-manager.ts + chromium-manager.ts。"""
+
+import asyncio
+import atexit
+import json
+import os
+import random
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import unquote, urlparse
+
+from playwright.async_api import Browser, BrowserContext, Playwright, async_playwright
+from playwright_stealth import StealthConfig
+
+from .logger import logger
+from .types import CommandOptions, EngineState, FingerprintConfig
+
+# 候选时区列表
+TIMEZONE_LIST = [
+    "Asia/Shanghai",
+]
+
+# Chromium 启动参数，对应 TypeScript 版本的优化配置
+BROWSER_ARGS = [
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-features=TranslateUI",
+    "--disable-ipc-flooding-protection",
+    "--disable-hang-monitor",
+    "--disable-prompt-on-repost",
+    "--disable-sync",
+    "--disable-web-security",
+    "--disable-features=VizDisplayCompositor",
+    "--disable-dev-shm-usage",
+]
+
+
+# 解析器从不读取的资源类型，直接中止请求以减少传输字节
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "stylesheet"}
+
+# 第三方跟踪/广告域名拒绝列表，按 URL 子串匹配
+BLOCKED_URL_PATTERNS = (
+    "doubleclick.net",
+    "googlesyndication.com",
+    "google-analytics.com",
+    "gstatic.com/recaptcha",
+)
+
+
+# 桌面 Chrome 设备描述符缓存：devices 字典很大且取值返回驱动持有的
+# 共享对象，进程内只在首次启动后拷贝一次
+_DEVICE_CACHE: Optional[Dict[str, Dict[str, Any]]] = None
+
+
+def _get_device_cache(playwright: Playwright) -> Dict[str, Dict[str, Any]]:
+    """首次调用时把桌面 Chrome 设备描述符拷贝进进程级缓存"""
+    global _DEVICE_CACHE
+    if _DEVICE_CACHE is None:
+        devices = playwright.devices
+        _DEVICE_CACHE = {
+            name: dict(devices[name])
+            for name in devices
+            if not devices[name].get("is_mobile")
+            and "Chrome" in devices[name].get("user_agent", "")
+        }
+    return _DEVICE_CACHE
+
+
+# stealth 脚本拼接结果，进程内只读取一次
+_stealth_js: Optional[str] = None
+
+
+def _get_stealth_js() -> str:
+    """拼接 stealth 初始化脚本并缓存
+
+    通过 add_init_script 一次性注入，Playwright 会把初始化脚本随建页的
+    CDP 消息批量下发，省掉 stealth_async 逐脚本注入的额外往返。
+    """
+    global _stealth_js
+    if _stealth_js is None:
+        _stealth_js = "\n".join(StealthConfig().enabled_scripts)
+    return _stealth_js
+
+
+async def _block_non_essential(route) -> None:
+    """中止非必要资源请求（图片/字体/媒体/样式及第三方跟踪）"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+        return
+    url = request.url
+    if any(pattern in url for pattern in BLOCKED_URL_PATTERNS):
+        await route.abort()
+        return
+    await route.continue_()
+
+
+# 跨查询复用的共享实例（MCP/批量模式），通过 get_or_create() 访问
+_shared: Optional["BrowserManager"] = None
+_shared_lock = asyncio.Lock()
+
+
+class BrowserManager:
+    """管理 Playwright 浏览器的启动、指纹与状态持久化"""
+
+    def __init__(self, options: Optional[CommandOptions] = None):
+        self.options = options or CommandOptions()
+        self.playwright: Optional[Playwright] = None
+        self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
+        # 上下文池：多上下文是单浏览器内并发的推荐原语，创建开销远低于浏览器
+        self._ctx_pool: Optional["asyncio.Queue[BrowserContext]"] = None
+        self._pool_lock = asyncio.Lock()
+        # 首次使用后记住指纹，保证关闭时持久化的就是实际使用的那份
+        self._fingerprint: Optional[FingerprintConfig] = None
+        self._device_names: Optional[tuple] = None
+        # 实例私有 RNG，避免并发场景下争用全局 random 的锁
+        self._rng = random.Random()
+
+        local_state_dir = Path(".playwright-search").resolve()
+        home_state_dir = Path.home() / ".playwright-search"
+        state_dir = local_state_dir if local_state_dir.exists() else home_state_dir
+        if self.options.user_data_dir:
+            state_dir = Path(self.options.user_data_dir)
+
+        self.state_dir = state_dir
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        self.fingerprint_file = self.state_dir / "browser-state-fingerprint.json"
+        self.storage_state_file = self.state_dir / "browser-state.json"
+
+    def load_engine_state(self, engine_id: str) -> EngineState:
+        """加载指定引擎的指纹和代理状态"""
+        saved = self._load_fingerprint_from_file()
+        if engine_id in saved:
+            return EngineState.model_validate(saved[engine_id])
+        return EngineState()
+
+    def _load_fingerprint_from_file(self) -> Dict[str, Any]:
+        if self.fingerprint_file.exists():
+            try:
+                saved = json.loads(self.fingerprint_file.read_text(encoding="utf-8"))
+                logger.info("已加载所有引擎的浏览器指纹和代理配置")
+                return saved
+            except (OSError, ValueError) as e:
+                logger.warning(f"无法加载指纹或代理配置文件，将创建新的: {e}")
+        return {}
+
+    def save_engine_state(self, engine_id: str, engine_state: EngineState) -> None:
+        """保存指定引擎的指纹和代理状态"""
+        if self.options.no_save_state:
+            return
+        try:
+            saved = self._load_fingerprint_from_file()
+            current = saved.get(engine_id, {})
+            current.update(engine_state.model_dump(exclude_none=True))
+            saved[engine_id] = current
+            self.fingerprint_file.write_text(
+                json.dumps(saved, ensure_ascii=False, indent=2), encoding="utf-8"
+            )
+            logger.info(f"已为引擎 '{engine_id}' 保存指纹和代理配置")
+        except OSError as e:
+            logger.error(f"保存浏览器状态/指纹/代理失败 for engine '{engine_id}': {e}")
+
+    def _desktop_device_names(self) -> tuple:
+        """桌面 Chrome 设备名列表，取自进程级设备缓存"""
+        if self._device_names is None:
+            self._device_names = tuple(_get_device_cache(self.playwright))
+        return self._device_names
+
+    def _get_random_device_config(self) -> tuple:
+        """从设备缓存中随机选择一个桌面 Chrome 设备"""
+        device_name = self._rng.choice(self._desktop_device_names())
+        device = dict(_get_device_cache(self.playwright)[device_name])
+        # 强制设置分辨率
+        device["viewport"] = {"width": 1200, "height": 768}
+        return device_name, device
+
+    def _get_random_timezone(self) -> str:
+        return self._rng.choice(TIMEZONE_LIST)
+
+    def _get_host_machine_config(self, user_locale: Optional[str] = None) -> FingerprintConfig:
+        """获取宿主机器的实际配置作为浏览器指纹"""
+        system_locale = user_locale or os.environ.get("LANG") or "zh-CN"
+        timezone_id = self._get_random_timezone()
+        hour = datetime.now().hour
+        color_scheme = "dark" if hour >= 18 or hour <= 6 else "light"
+
+        device_name, device = self._get_random_device_config()
+        return FingerprintConfig(
+            device_name=device_name,
+            locale=system_locale,
+            timezone_id=timezone_id,
+            color_scheme=color_scheme,
+            reduced_motion="no-preference",
+            forced_colors="none",
+            viewport=device["viewport"],
+            user_agent=device.get("user_agent"),
+        )
+
+    def _parse_proxy_config(self, proxy_url: str) -> Dict[str, str]:
+        """解析代理配置"""
+        try:
+            u = urlparse(proxy_url)
+            server = f"{u.scheme}://{u.hostname}"
+            if u.port:
+                server += f":{u.port}"
+            cfg: Dict[str, str] = {"server": server}
+            if u.username:
+                cfg["username"] = unquote(u.username)
+            if u.password:
+                cfg["password"] = unquote(u.password)
+            return cfg
+        except ValueError:
+            logger.warning(f"代理URL解析失败: {proxy_url}")
+            return {"server": proxy_url}
+
+    @classmethod
+    async def get_or_create(cls, options: Optional[CommandOptions] = None) -> "BrowserManager":
+        """获取共享实例，首次调用时启动浏览器进程
+
+        浏览器冷启动（Playwright 驱动 + Chromium 进程）是每次查询的主要
+        固定开销，批量/MCP 模式下应只付一次，之后每个查询仅新建 Page。
+        """
+        global _shared
+        async with _shared_lock:
+            if _shared is None:
+                manager = cls(options)
+                await manager._ensure_browser()
+                _shared = manager
+            return _shared
+
+    @classmethod
+    async def close_shared(cls) -> None:
+        """关闭共享实例"""
+        global _shared
+        async with _shared_lock:
+            if _shared is not None:
+                await _shared.close()
+                _shared = None
+
+    async def _ensure_browser(self) -> Browser:
+        """确保 Playwright 驱动和浏览器进程已启动"""
+        if self.browser is None:
+            self.playwright = await async_playwright().start()
+            self.browser = await self.playwright.chromium.launch(
+                headless=self.options.headless,
+                args=BROWSER_ARGS,
+            )
+        return self.browser
+
+    async def init_context_pool(self, engine_state: Optional[EngineState] = None) -> None:
+        """预热上下文池，池内所有上下文共享同一份指纹
+
+        加锁防止并发的 acquire_context() 同时预热出两个池、泄漏其中
+        一个的上下文。
+        """
+        async with self._pool_lock:
+            if self._ctx_pool is not None:
+                return
+            engine_state = engine_state or self.load_engine_state(self.options.engine)
+            size = max(1, self.options.concurrency)
+            pool: "asyncio.Queue[BrowserContext]" = asyncio.Queue(maxsize=size)
+            for _ in range(size):
+                pool.put_nowait(await self._create_context(engine_state))
+            self._ctx_pool = pool
+            logger.info("上下文池预热完成, 大小: {}", size)
+
+    async def acquire_context(self) -> BrowserContext:
+        """从池中取出一个上下文，池未初始化时先预热"""
+        if self._ctx_pool is None:
+            await self.init_context_pool()
+        return await self._ctx_pool.get()
+
+    async def release_context(self, context: BrowserContext) -> None:
+        """将上下文归还到池中"""
+        if self._ctx_pool is not None:
+            await self._ctx_pool.put(context)
+        else:
+            await context.close()
+
+    async def launch_browser(self, engine_state: Optional[EngineState] = None) -> BrowserContext:
+        """启动浏览器并创建带指纹的上下文"""
+        self.context = await self._create_context(engine_state)
+        return self.context
+
+    async def _create_context(self, engine_state: Optional[EngineState] = None) -> BrowserContext:
+        """创建带指纹的浏览器上下文，状态恢复只在创建时做一次"""
+        engine_state = engine_state or EngineState()
+
+        await self._ensure_browser()
+
+        # 使用已保存的指纹，或创建新的；同一实例内只生成一次
+        fingerprint = (
+            engine_state.fingerprint
+            or self._fingerprint
+            or self._get_host_machine_config(self.options.locale)
+        )
+        engine_state.fingerprint = fingerprint
+        self._fingerprint = fingerprint
+
+        context_options: Dict[str, Any] = {
+            "locale": fingerprint.locale,
+            "viewport": fingerprint.viewport,
+            "user_agent": fingerprint.user_agent,
+            "timezone_id": fingerprint.timezone_id,
+            "color_scheme": fingerprint.color_scheme,
+            "forced_colors": fingerprint.forced_colors,
+            "reduced_motion": fingerprint.reduced_motion,
+        }
+
+        # 恢复已保存的浏览器状态
+        if self.storage_state_file.exists():
+            context_options["storage_state"] = str(self.storage_state_file)
+
+        # 配置代理，命令行传入的代理优先级更高
+        proxy = self.options.proxy or engine_state.proxy
+        if proxy:
+            context_options["proxy"] = self._parse_proxy_config(proxy)
+
+        context = await self.browser.new_context(**context_options)
+        if self.options.stealth:
+            await context.add_init_script(_get_stealth_js())
+
+        # 中止解析器用不到的资源，显著减少每次搜索的传输字节
+        if self.options.block_assets:
+            await context.route("**/*", _block_non_essential)
+
+        logger.info("浏览器上下文启动成功, 设备: {}", fingerprint.device_name)
+        return context
+
+    async def close(self) -> None:
+        """保存状态并关闭浏览器"""
+        # 收集单上下文和池里的所有上下文，持久化后统一关闭
+        contexts = []
+        if self.context:
+            contexts.append(self.context)
+            self.context = None
+        if self._ctx_pool is not None:
+            while not self._ctx_pool.empty():
+                contexts.append(self._ctx_pool.get_nowait())
+            self._ctx_pool = None
+
+        if contexts and not self.options.no_save_state:
+            try:
+                await contexts[0].storage_state(path=str(self.storage_state_file))
+                if self._fingerprint is not None:
+                    engine_state = EngineState(fingerprint=self._fingerprint)
+                    self.save_engine_state(self.options.engine, engine_state)
+            except Exception as e:
+                logger.error(f"保存浏览器状态失败: {e}")
+
+        for context in contexts:
+            await context.close()
+        if self.browser:
+            await self.browser.close()
+            self.browser = None
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+
+
+def _close_shared_at_exit() -> None:
+    """进程退出时关闭共享浏览器实例"""
+    if _shared is not None:
+        try:
+            asyncio.run(BrowserManager.close_shared())
+        except RuntimeError:
+            # 事件循环仍在运行时无法同步关闭，交由进程退出回收
+            pass
+
+
+atexit.register(_close_shared_at_exit)
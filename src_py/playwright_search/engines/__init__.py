@@ -0,0 +1,28 @@
+"""搜索引擎实现，对应 TypeScript 版本的 engines/ 目录。"""
+
+from typing import TYPE_CHECKING
+
+from .base import AntiBotDetectedError, BaseEngine
+from .google import GoogleEngine
+
+if TYPE_CHECKING:
+    from ..browser_manager import BrowserManager
+    from ..types import CommandOptions
+
+# 引擎注册表
+ENGINES = {
+    "google": GoogleEngine,
+}
+
+
+def create_engine(
+    engine_id: str, options: "CommandOptions", browser_manager: "BrowserManager"
+) -> BaseEngine:
+    """根据引擎ID创建搜索引擎实例"""
+    engine_cls = ENGINES.get(engine_id)
+    if engine_cls is None:
+        raise ValueError(f"不支持的搜索引擎: {engine_id}，可用引擎: {', '.join(ENGINES)}")
+    return engine_cls(options, browser_manager)
+
+
+__all__ = ["AntiBotDetectedError", "BaseEngine", "GoogleEngine", "create_engine", "ENGINES"]
@@ -0,0 +1,173 @@
+"""搜索引擎基类，对应 TypeScript 版本的 engines/base.ts。"""
+
+import asyncio
+import random
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+from urllib.parse import quote, urlparse
+
+from playwright.async_api import Page
+
+from ..logger import logger
+from ..types import CommandOptions, EngineConfig, SearchResult
+
+if TYPE_CHECKING:
+    from ..browser_manager import BrowserManager
+
+
+# 零宽字符删除表与空白折叠正则，模块级预编译（每条结果的三个字段都要经过）
+_ZWSP_TABLE = str.maketrans("", "", "\u200b\u200c\u200d\ufeff")
+_WS_RE = re.compile(r"\s+")
+
+# 送入 page.evaluate 的脚本统一放在模块级，避免每次调用重建字符串
+_SCROLL_JS = "window.scrollTo(0, Math.random() * 500)"
+
+
+class AntiBotDetectedError(Exception):
+    """检测到反爬虫机制，需要人工干预"""
+
+
+class BaseEngine:
+    """配置化的搜索引擎基类"""
+
+    def __init__(
+        self,
+        config: EngineConfig,
+        options: CommandOptions,
+        browser_manager: "BrowserManager",
+    ):
+        self.config = config
+        self.options = options
+        self.browser_manager = browser_manager
+        # 实例私有 RNG，避免并发引擎争用全局 random 的锁
+        self._rng = random.Random()
+
+    async def search(self, query: str):
+        raise NotImplementedError
+
+    def _build_search_url(self, query: str) -> str:
+        """构建搜索URL，search_path 中的 {limit} 占位符以结果数量填充"""
+        search_path = self.config.search_path
+        if "{limit}" in search_path:
+            search_path = search_path.format(limit=self.options.limit or 10)
+        return f"{self.config.base_url}{search_path}{quote(query)}"
+
+    async def _setup_page_headers(self, page: Page) -> None:
+        """设置页面头信息"""
+        if self.config.headers:
+            await page.set_extra_http_headers(self.config.headers)
+
+    async def _navigate_to_search_page(self, page: Page, query: str) -> None:
+        """导航到搜索页面
+
+        使用 domcontentloaded 代替 networkidle：Google 的长轮询和广告请求
+        会让 networkidle 多等 1~2 秒，结果容器的出现由 _wait_for_page_load
+        的选择器等待来保证。
+        """
+        search_url = self._build_search_url(query)
+        logger.info("正在导航到{}搜索页面: {}", self.config.name, search_url)
+        await page.goto(
+            search_url,
+            wait_until="domcontentloaded",
+            timeout=self.options.timeout or 60000,
+        )
+        await self._wait_for_page_load(page)
+        # 反爬虫节奏控制只在有头模式下需要
+        if self.config.custom_delay and not self.options.headless:
+            delay = self._get_random_delay(
+                self.config.custom_delay.min, self.config.custom_delay.max
+            )
+            await asyncio.sleep(delay / 1000)
+
+    async def _wait_for_page_load(self, page: Page) -> None:
+        """等待搜索结果容器出现"""
+        try:
+            await page.wait_for_selector(
+                self.config.selectors.result_container, timeout=15000
+            )
+        except Exception:
+            logger.warning("等待搜索结果超时，继续处理")
+            await self._debug_screenshot(page, "wait-timeout")
+
+    async def _debug_screenshot(self, page: Page, tag: str) -> None:
+        """仅在 --debug 下保存截图
+
+        只截视口并用 JPEG 编码：整页 PNG 截图要重渲染整个滚动区域外加
+        PNG 编码，在失败路径上动辄数百毫秒到数秒。
+        """
+        if not self.options.debug:
+            return
+        try:
+            await page.screenshot(
+                path=str(self._debug_path(tag)), type="jpeg", quality=60
+            )
+        except Exception as e:
+            logger.debug("调试截图失败: {}", e)
+
+    def _debug_path(self, tag: str) -> Path:
+        """生成调试文件（截图等）的保存路径"""
+        debug_dir = Path("search_results")
+        debug_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        return debug_dir / f"{self.config.id}-{tag}-{timestamp}.jpg"
+
+    async def _save_html(self, page: Page, query: str) -> None:
+        """保存页面HTML内容"""
+        if not self.options.save_html:
+            return
+        try:
+            html = await page.content()
+            out_dir = Path("search_results")
+            out_dir.mkdir(parents=True, exist_ok=True)
+            timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+            filepath = out_dir / f"{self.config.name}-{query.replace(' ', '_')}-{timestamp}.html"
+            filepath.write_text(html, encoding="utf-8")
+            logger.info("HTML已保存: {}", filepath)
+        except OSError as e:
+            logger.error(f"保存HTML文件失败: {e}")
+
+    def _get_random_delay(self, min_ms: int, max_ms: int) -> int:
+        """获取随机延迟时间（毫秒）"""
+        return self._rng.randint(min_ms, max_ms)
+
+    def _clean_text(self, text: Optional[str]) -> str:
+        """清理文本：去除零宽字符并折叠空白"""
+        if not text:
+            return ""
+        return _WS_RE.sub(" ", text.translate(_ZWSP_TABLE)).strip()
+
+    def _is_valid_link(self, href: str) -> bool:
+        """验证链接"""
+        try:
+            url = urlparse(href)
+            return url.scheme in ("http", "https")
+        except ValueError:
+            return False
+
+    def _create_search_result(self, title: str, link: str, snippet: str) -> SearchResult:
+        """创建搜索结果
+
+        三个字段都已经过 _clean_text 归一化，model_construct 跳过
+        pydantic 校验，构造开销显著低于常规构造。
+        """
+        return SearchResult.model_construct(
+            title=self._clean_text(title),
+            link=self._clean_text(link),
+            snippet=self._clean_text(snippet),
+        )
+
+    async def _handle_anti_bot(self, page: Page) -> None:
+        """执行基本的反检测措施"""
+        viewport_size = page.viewport_size or {"width": 800, "height": 600}
+        width, height = viewport_size["width"], viewport_size["height"]
+        # 随机鼠标移动
+        await page.mouse.move(
+            self._rng.uniform(0, width),
+            self._rng.uniform(0, height),
+        )
+        # 随机滚动
+        await page.evaluate(_SCROLL_JS)
+        # 短暂等待
+        await asyncio.sleep(self._get_random_delay(1500, 3500) / 1000)
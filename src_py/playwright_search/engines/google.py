@@ -0,0 +1,231 @@
+"""Google 搜索引擎实现，对应 TypeScript 版本的 engine-config/google.json。"""
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+import aiohttp
+
+from playwright.async_api import BrowserContext, Page
+from selectolax.parser import HTMLParser, Node
+
+from ..logger import logger
+from ..types import (
+    CommandOptions,
+    DelayRange,
+    EngineConfig,
+    EngineSelectors,
+    SearchResponse,
+    SearchResult,
+)
+from .base import AntiBotDetectedError, BaseEngine
+
+if TYPE_CHECKING:
+    from ..browser_manager import BrowserManager
+
+# gbv=1 返回无需JS的基础版HTML，体积约为现代SPA版的1/10
+GOOGLE_CONFIG = EngineConfig(
+    id="google",
+    name="Google",
+    base_url="https://www.google.com.hk",
+    search_path="/search?gbv=1&num={limit}&q=",
+    selectors=EngineSelectors(
+        result_container="div.ezO2md, .g, div[data-sokoban-container], .Gx5Zad, .tF2Cxc, .hlcw0c",
+        title="h3, span.CVA68e, .LC20lb, .DKV0Md",
+        link="a, .yuRUbf a",
+        snippet="span.FrIlee, .VwiC3b, div[data-sncf='1'], .s, .IsZvec",
+    ),
+    headers={"Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8"},
+    custom_delay=DelayRange(min=1000, max=3000),
+)
+
+# aiohttp 快速路径使用的桌面 Chrome User-Agent
+_HTTP_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# 基础版页面上出现这些标记说明触发了人机验证，需要回退到浏览器
+_CAPTCHA_MARKERS = ("id=\"captcha-form\"", "unusual traffic", "recaptcha")
+
+# 送入 page.evaluate 的反爬虫探测脚本，模块级常量避免每次调用重建
+_CAPTCHA_PROBE_JS = "() => !!document.querySelector('iframe[src*=recaptcha]')"
+
+# 标题与摘要选择器，兼容基础版(gbv=1)和现代版布局
+_TITLE_SELECTOR = "h3, span.CVA68e"
+_SNIPPET_SELECTOR = "span.FrIlee, .VwiC3b, div[data-sncf='1'], .s, .IsZvec"
+
+
+class GoogleEngine(BaseEngine):
+    """Google 搜索引擎"""
+
+    def __init__(self, options: CommandOptions, browser_manager: "BrowserManager"):
+        super().__init__(GOOGLE_CONFIG, options, browser_manager)
+
+    async def search(self, query: str) -> SearchResponse:
+        start_time = time.monotonic()
+        results = await self._try_http_fetch(query)
+        if results is None:
+            # 只有回退到浏览器时才取用（并按需预热）上下文池
+            context = await self.browser_manager.acquire_context()
+            try:
+                results = await self._browser_search(context, query)
+            finally:
+                await self.browser_manager.release_context(context)
+        search_time = time.monotonic() - start_time
+        logger.info(
+            "Google搜索完成, 共 {} 个结果, 耗时 {:.2f}s", len(results), search_time
+        )
+        # 字段均为本地构造的已知合法值，跳过 pydantic 校验
+        return SearchResponse.model_construct(
+            query=query,
+            results=results,
+            total_results=len(results),
+            search_time=search_time,
+            engine=self.config.id,
+        )
+
+    async def _try_http_fetch(self, query: str) -> Optional[List[SearchResult]]:
+        """快速路径：直接用 aiohttp 抓取 gbv=1 基础版页面
+
+        基础版是静态HTML，不需要浏览器渲染。成功时整个 Chromium 流程都被
+        绕开；请求失败、触发人机验证或解析为空时返回 None，回退到浏览器。
+        """
+        proxy = (
+            self.options.proxy
+            or self.browser_manager.load_engine_state(self.config.id).proxy
+        )
+        if proxy and not proxy.startswith("http"):
+            # aiohttp 只支持 http(s) 代理，socks 等代理必须走浏览器路径
+            logger.info("代理 {} 无法用于HTTP快速路径, 回退到浏览器", proxy)
+            return None
+
+        url = self._build_search_url(query)
+        headers = {"User-Agent": _HTTP_USER_AGENT, **self.config.headers}
+        timeout = aiohttp.ClientTimeout(total=(self.options.timeout or 30000) / 1000)
+        try:
+            async with aiohttp.ClientSession(timeout=timeout) as session:
+                async with session.get(url, headers=headers, proxy=proxy) as resp:
+                    if resp.status != 200:
+                        logger.warning("HTTP快速路径返回 {}, 回退到浏览器", resp.status)
+                        return None
+                    html = await resp.text()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning("HTTP快速路径请求失败, 回退到浏览器: {}", e)
+            return None
+
+        lowered = html.lower()
+        if any(marker in lowered for marker in _CAPTCHA_MARKERS):
+            logger.warning("HTTP快速路径触发人机验证, 回退到浏览器")
+            return None
+
+        results = self._parse_html(html)
+        if not results:
+            logger.warning("HTTP快速路径未解析到结果, 回退到浏览器")
+            return None
+        logger.info("HTTP快速路径命中, 共 {} 个结果", len(results))
+        return results
+
+    async def _browser_search(self, context: BrowserContext, query: str) -> List[SearchResult]:
+        """完整的 Playwright 搜索流程"""
+        page = await context.new_page()
+        try:
+            await self._setup_page_headers(page)
+            await self._navigate_to_search_page(page, query)
+            await self._handle_anti_bot(page)
+            await self._save_html(page, query)
+            return await self._parse_results(page)
+        except Exception as e:
+            logger.error(f"Google搜索失败: {e}")
+            if not page.is_closed():
+                await self._debug_screenshot(page, "search-error")
+            raise
+        finally:
+            if not page.is_closed():
+                await page.close()
+
+    async def _handle_anti_bot(self, page: Page) -> None:
+        """检测reCAPTCHA验证码
+
+        验证码几乎从不出现，所以探测必须便宜：单次 DOM 查询立即返回，
+        代替原来 wait_for_selector 最长 5 秒的轮询等待。
+        """
+        logger.info("开始检测Google反爬虫机制...")
+        has_captcha = await page.evaluate(_CAPTCHA_PROBE_JS)
+        if not has_captcha:
+            logger.info("未检测到Google反爬虫机制，继续执行。")
+            await super()._handle_anti_bot(page)
+            return
+        logger.warning("检测到Google反爬虫机制！")
+        await self._debug_screenshot(page, "recaptcha")
+        raise AntiBotDetectedError("Google检测到reCAPTCHA，需要人工干预来解决验证码。")
+
+    async def _parse_results(self, page: Page) -> List[SearchResult]:
+        """解析搜索结果
+
+        在 Python 侧用 selectolax（C 实现的 Lexbor 解析器）解析 page.content()，
+        省掉 page.evaluate 跨 CDP 边界的往返和结果列表的序列化。
+        """
+        html = await page.content()
+        results = self._parse_html(html)
+
+        if not results:
+            logger.warning("未解析到任何Google搜索结果")
+            await self._debug_screenshot(page, "no-results")
+        return results
+
+    def _parse_html(self, html: str) -> List[SearchResult]:
+        """从HTML中提取搜索结果，同时兼容基础版(gbv=1)和现代版布局
+
+        从标题节点出发向上找所在链接：完整结果页的 <a> 动辄数百个，而
+        标题节点数量与结果数同阶，遍历量小一个数量级。
+        """
+        limit = self.options.limit or 10
+        tree = HTMLParser(html)
+
+        results: List[SearchResult] = []
+        for title_el in tree.css(_TITLE_SELECTOR):
+            if len(results) >= limit:
+                break
+            link = title_el.parent
+            while link is not None and link.tag != "a":
+                link = link.parent
+            if link is None:
+                continue
+            href = self._unwrap_redirect(link.attributes.get("href") or "")
+            if not self._is_valid_link(href) or "google.com/search" in href:
+                continue
+            snippet = self._extract_snippet(link)
+            results.append(self._create_search_result(title_el.text(), href, snippet))
+        return results
+
+    @staticmethod
+    def _unwrap_redirect(href: str) -> str:
+        """解开基础版(gbv=1)布局的 /url?q=<目标>&sa=U 跳转链接"""
+        if href.startswith("/url?"):
+            target = parse_qs(urlparse(href).query).get("q")
+            if target:
+                return target[0]
+        return href
+
+    def _extract_snippet(self, link: Node) -> str:
+        """沿父节点向上找到结果容器并提取摘要，等价于 JS 版的 link.closest(...)"""
+        container = link.parent
+        while container is not None:
+            if self._is_result_container(container):
+                snippet_el = container.css_first(_SNIPPET_SELECTOR)
+                return snippet_el.text() if snippet_el is not None else ""
+            container = container.parent
+        return ""
+
+    @staticmethod
+    def _is_result_container(node: Node) -> bool:
+        """判断节点是否为搜索结果容器"""
+        if node.tag != "div":
+            return False
+        attrs = node.attributes
+        if "data-sokoban-container" in attrs:
+            return True
+        classes = set((attrs.get("class") or "").split())
+        return bool(classes & {"ezO2md", "g", "s", "tF2Cxc", "Gx5Zad", "hlcw0c"})
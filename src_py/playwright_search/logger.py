@@ -0,0 +1,36 @@
+"""日志配置，对应 TypeScript 版本的 logger.ts（pino → loguru）。"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+from loguru import logger
+
+# 使用系统临时目录，确保跨平台兼容性
+_log_dir = Path(tempfile.gettempdir()) / "playwright-search-logs"
+_log_dir.mkdir(parents=True, exist_ok=True)
+
+log_file_path = _log_dir / "playwright-search.log"
+
+# 控制台输出；非终端（管道/MCP模式）下不做着色
+logger.remove()
+logger.add(
+    sys.stderr,
+    level=os.getenv("LOG_LEVEL", "INFO"),
+    colorize=sys.stderr.isatty(),
+)
+
+# 文件落盘默认只记 WARNING 以上，LOG_FILE_LEVEL=OFF 可完全关闭；
+# enqueue=True 让格式化和写盘在独立线程进行，不阻塞事件循环
+_file_level = os.getenv("LOG_FILE_LEVEL", "WARNING").upper()
+if _file_level != "OFF":
+    logger.add(
+        log_file_path,
+        level=_file_level,
+        rotation="10 MB",
+        encoding="utf-8",
+        enqueue=True,
+    )
+
+__all__ = ["logger", "log_file_path"]
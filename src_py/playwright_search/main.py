@@ -0,0 +1,162 @@
+"""命令行入口，对应 TypeScript 版本的 index.ts（commander → click）。"""
+
+import asyncio
+import hashlib
+from typing import List, Optional, Tuple
+
+import click
+import orjson
+from diskcache import Cache
+
+from .browser_manager import BrowserManager
+from .engines import create_engine
+from .logger import logger
+from .types import CommandOptions, SearchResponse
+
+
+def _cache_key(options: CommandOptions, query: str) -> str:
+    """缓存键：引擎 + 结果数量 + 查询摘要"""
+    digest = hashlib.blake2b(query.encode("utf-8")).hexdigest()
+    return f"{options.engine}:{options.limit}:{digest}"
+
+
+async def _search_one(
+    browser_manager: BrowserManager,
+    options: CommandOptions,
+    query: str,
+    semaphore: asyncio.Semaphore,
+    cache: Optional[Cache],
+) -> SearchResponse:
+    """执行单个查询，带缓存和并发上限"""
+    if cache is not None:
+        key = _cache_key(options, query)
+        # diskcache 是同步实现，放到线程池避免阻塞事件循环
+        cached = await asyncio.to_thread(cache.get, key)
+        if cached is not None:
+            logger.info("缓存命中: {}", query)
+            return SearchResponse.model_validate_json(cached)
+
+    async with semaphore:
+        search_engine = create_engine(options.engine, options, browser_manager)
+        response = await search_engine.search(query)
+
+    if cache is not None:
+        await asyncio.to_thread(
+            cache.set, key, response.model_dump_json(), expire=options.cache_ttl
+        )
+    return response
+
+
+async def _search_all(
+    options: CommandOptions, queries: Tuple[str, ...]
+) -> List[SearchResponse]:
+    """多个查询在上下文池上并发执行，信号量限制并发度防止渲染器过载
+
+    上下文池按需预热：全部命中缓存或HTTP快速路径时不会启动 Chromium。
+    """
+    cache = Cache(options.cache_dir) if options.cache_dir else None
+    if options.reuse_browser:
+        browser_manager = await BrowserManager.get_or_create(options)
+    else:
+        browser_manager = BrowserManager(options)
+    semaphore = asyncio.Semaphore(options.concurrency)
+    try:
+        tasks = [
+            _search_one(browser_manager, options, query, semaphore, cache)
+            for query in queries
+        ]
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        # 共享浏览器由 atexit 的 close_shared() 统一关闭
+        if not options.reuse_browser:
+            await browser_manager.close()
+
+    responses: List[SearchResponse] = []
+    for query, outcome in zip(queries, outcomes):
+        if isinstance(outcome, BaseException):
+            logger.error("查询 '{}' 失败: {}", query, outcome)
+        else:
+            responses.append(outcome)
+    if not responses:
+        raise SystemExit(1)
+    return responses
+
+
+@click.command()
+@click.argument("queries", nargs=-1, required=True)
+@click.option("-l", "--limit", default=10, show_default=True, help="结果数量限制")
+@click.option("-t", "--timeout", default=30000, show_default=True, help="超时时间(毫秒)")
+@click.option(
+    "--headless/--no-headless",
+    default=True,
+    help="以无头模式启动浏览器（遇到人机验证可切换为有头模式）",
+)
+@click.option("--no-save-state", is_flag=True, help="不保存浏览器状态")
+@click.option("--save-html", is_flag=True, help="将HTML保存到文件")
+@click.option("--proxy", default=None, help="代理服务器(示例: socks5://127.0.0.1:1080)")
+@click.option("--locale", default=None, help="搜索结果语言，默认为中文(zh-CN)")
+@click.option(
+    "-e", "--engine", default="google", show_default=True, help="搜索引擎 (google)"
+)
+@click.option(
+    "--user-data-dir",
+    default=None,
+    help="浏览器用户数据目录，默认在用户根目录下.playwright-search",
+)
+@click.option(
+    "--reuse-browser",
+    is_flag=True,
+    help="复用共享浏览器实例，避免每次查询冷启动（批量/MCP模式）",
+)
+@click.option(
+    "--concurrency",
+    default=4,
+    show_default=True,
+    help="上下文池大小，即并发查询上限",
+)
+@click.option(
+    "--block-assets/--no-block-assets",
+    default=True,
+    help="屏蔽图片/字体/媒体/样式及第三方跟踪请求以加速页面加载",
+)
+@click.option(
+    "--stealth/--no-stealth",
+    default=True,
+    help="注入 stealth 反检测脚本（可信端点可关闭以加速建页）",
+)
+@click.option(
+    "--cache-dir",
+    default=None,
+    help="搜索结果磁盘缓存目录，不传则不缓存",
+)
+@click.option(
+    "--cache-ttl",
+    default=3600,
+    show_default=True,
+    help="缓存有效期（秒）",
+)
+@click.option("--debug", is_flag=True, help="失败路径保存调试截图")
+def cli(queries: Tuple[str, ...], **kwargs) -> None:
+    """基于 Playwright 的搜索引擎 MCP 工具，支持一次传入多个查询"""
+    options = CommandOptions(**kwargs)
+
+    try:
+        responses = asyncio.run(_search_all(options, queries))
+    except SystemExit:
+        raise
+    except Exception as e:
+        logger.error(f"搜索失败: {e}")
+        raise SystemExit(1)
+
+    # 单查询保持原有的单对象输出，多查询输出数组
+    if len(responses) == 1:
+        click.echo(responses[0].model_dump_json(indent=2))
+    else:
+        payload = orjson.dumps(
+            [r.model_dump() for r in responses], option=orjson.OPT_INDENT_2
+        ).decode()
+        click.echo(payload)
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,108 @@
+"""数据模型定义，对应 TypeScript 版本的 types.ts（zod → pydantic）。"""
+
+from typing import Dict, List, Optional
+
+import orjson
+from pydantic import BaseModel, ConfigDict
+
+# 这些模型构造后只读；冻结并忽略多余字段可以让 pydantic 省掉
+# 赋值校验等可变性开销
+_FROZEN_CONFIG = ConfigDict(frozen=True, populate_by_name=True, extra="ignore")
+
+
+class SearchResult(BaseModel):
+    """单条搜索结果"""
+
+    model_config = _FROZEN_CONFIG
+
+    title: str
+    link: str
+    snippet: str
+
+
+class SearchResponse(BaseModel):
+    """搜索响应"""
+
+    model_config = _FROZEN_CONFIG
+
+    query: str
+    results: List[SearchResult]
+    total_results: int
+    search_time: float
+    engine: str
+
+    def model_dump_json(self, *, indent: Optional[int] = None, **kwargs) -> str:
+        """用 orjson 序列化，大结果集下比默认编码器快数倍"""
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(self.model_dump(**kwargs), option=option).decode()
+
+
+class CommandOptions(BaseModel):
+    """命令行选项"""
+
+    model_config = _FROZEN_CONFIG
+
+    limit: int = 10
+    timeout: int = 30000
+    headless: bool = True
+    no_save_state: bool = False
+    locale: Optional[str] = None  # 搜索结果语言，默认为中文(zh-CN)
+    proxy: Optional[str] = None  # 代理服务器，如 socks5://127.0.0.1:1080
+    engine: str = "google"  # 搜索引擎: google
+    save_html: bool = False  # 是否保存HTML结果
+    user_data_dir: Optional[str] = None
+    reuse_browser: bool = False  # 复用共享浏览器实例（批量/MCP模式）
+    concurrency: int = 4  # 上下文池大小，即并发查询上限
+    block_assets: bool = True  # 屏蔽图片/字体/媒体/样式及第三方跟踪请求
+    stealth: bool = True  # 注入 stealth 反检测脚本
+    cache_dir: Optional[str] = None  # 搜索结果磁盘缓存目录，None 表示不缓存
+    cache_ttl: int = 3600  # 缓存有效期（秒）
+    debug: bool = False  # 失败路径保存调试截图
+
+
+class FingerprintConfig(BaseModel):
+    """浏览器指纹配置"""
+
+    device_name: str
+    locale: str
+    timezone_id: str
+    color_scheme: str  # "dark" | "light"
+    reduced_motion: str  # "reduce" | "no-preference"
+    forced_colors: str  # "active" | "none"
+    viewport: Optional[Dict[str, int]] = None
+    user_agent: Optional[str] = None
+
+
+class EngineState(BaseModel):
+    """每个引擎的独立状态"""
+
+    fingerprint: Optional[FingerprintConfig] = None
+    proxy: Optional[str] = None
+
+
+class DelayRange(BaseModel):
+    """随机延迟区间（毫秒）"""
+
+    min: int
+    max: int
+
+
+class EngineSelectors(BaseModel):
+    """搜索结果页面的选择器配置"""
+
+    result_container: str
+    title: str
+    link: str
+    snippet: str
+
+
+class EngineConfig(BaseModel):
+    """搜索引擎配置，对应 TypeScript 版本的 SearchEngineConfig"""
+
+    id: str
+    name: str
+    base_url: str
+    search_path: str
+    selectors: EngineSelectors
+    headers: Dict[str, str] = {}
+    custom_delay: Optional[DelayRange] = None